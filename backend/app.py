@@ -1,50 +1,266 @@
 import os
+import asyncio
+import atexit
+import httpx
+import msgspec
+import orjson
 import requests
 import logging
+import logging.config
+import hashlib
+import json
+import mimetypes
+import time
 import re
 import shutil
-import subprocess
-from flask import Flask, request, jsonify
+import signal
+import socket
+import stat
+import tempfile
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Annotated
+from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
-from urllib.parse import urlparse
+from urllib.parse import quote
+from werkzeug.utils import safe_join
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Load environment variables
 load_dotenv()
 
+# Configure logging in the same format as gunicorn's own log lines
+logging.config.dictConfig(
+    {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {
+                "format": "[%(asctime)s] [%(process)d] [%(levelname)s] %(name)s: %(message)s",
+                "datefmt": "%Y-%m-%d %H:%M:%S %z",
+            }
+        },
+        "handlers": {
+            "console": {"class": "logging.StreamHandler", "formatter": "default"}
+        },
+        "root": {
+            "level": os.getenv("LOG_LEVEL", "INFO").upper(),
+            "handlers": ["console"],
+        },
+    }
+)
+logger = logging.getLogger(__name__)
+
+
+class ORJSONProvider(JSONProvider):
+    """Serialize JSON requests and responses with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that sizes socket receive buffers from SOCKET_RCVBUF."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        # urllib3's defaults already set TCP_NODELAY
+        socket_options = list(HTTPConnection.default_socket_options)
+        if SOCKET_RCVBUF:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF))
+        kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Request payloads, decoded and validated in a single msgspec pass
+class ProcessGithubRequest(msgspec.Struct):
+    github_url: str
+
+
+# Each URL in a batch is fetched concurrently, so batches are capped
+class ProcessGithubBatchRequest(msgspec.Struct):
+    github_urls: Annotated[list[str], msgspec.Meta(min_length=1, max_length=50)]
+
+
+class CloneAndDeployRequest(msgspec.Struct):
+    github_url: str
+    project_name: str
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
+# Directory of this app, home of its private working files by default
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Local destination directory
 LOCAL_DESTINATION = os.getenv("LOCAL_DESTINATION", "/var/www/html")
 
+# Let the front web server transfer saved files with sendfile(2): X-Sendfile
+# for Apache/lighttpd, or X-Accel-Redirect to an internal nginx location
+# (e.g. "/_protected/") that maps to LOCAL_DESTINATION
+app.config["USE_X_SENDFILE"] = os.getenv("USE_X_SENDFILE", "false").lower() == "true"
+X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX")
+
+# Bytes read ahead of saving to check whether a download is an HTML page
+SNIFF_SIZE = 1024
+
+# Buffer size used when copying downloads to disk
+COPY_BUFFER_SIZE = 1 << 20
+
+# (connect, read) timeout in seconds for requests to GitHub
+REQUEST_TIMEOUT = (5, 30)
+
+# Receive buffer size in bytes for GitHub sockets (e.g. 4194304 for long,
+# high-bandwidth links); 0 leaves the kernel's buffer autotuning in charge
+SOCKET_RCVBUF = int(os.getenv("SOCKET_RCVBUF", "0"))
+
+# Shared HTTP session so connections to GitHub are pooled and reused
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    TunedHTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+# Ask for compressed bodies (plus br when a brotli decoder is installed);
+# they are decoded while streaming to disk
+SESSION.headers.update(
+    {"User-Agent": "diystudy/1.0", "Accept-Encoding": ACCEPT_ENCODING}
+)
+atexit.register(SESSION.close)
+
+# Destination directory with a trailing separator, for building paths inside it
+_DEST_PREFIX = os.path.join(LOCAL_DESTINATION, "")
+
+# Permissions given to saved files, as open() would create them; temp files
+# start out private to this user
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+# On-disk cache of downloaded files, keyed by SHA256 of the raw URL
+CACHE_DIR = os.path.join(LOCAL_DESTINATION, ".cache")
+
+# Seconds a cached file is served without revalidating against GitHub
+CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))
+
+# Maximum number of files kept in the cache
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "128"))
+
+# Per-project logs of git and npm output, kept out of the served directory
+LOG_DIR = os.getenv("LOG_DIR", os.path.join(BASE_DIR, "logs"))
+
+# Seconds a single git or npm command may run before it is killed
+COMMAND_TIMEOUT = int(os.getenv("COMMAND_TIMEOUT", "600"))
+
+# Job states and locks, stored on disk so every server process can see them,
+# and kept out of the served directory
+JOBS_DIR = os.getenv("JOBS_DIR", os.path.join(BASE_DIR, "jobs"))
+
+# Seconds a job's state is kept after its last update
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", "86400"))
+
+# Seconds between sweeps of expired job states in each server process
+JOB_PRUNE_INTERVAL = 60
+_last_job_prune = 0
+
+# Bytes of command output kept in memory for error messages
+LOG_TAIL_SIZE = 4096
+
+# Optional npm cache directory shared across deployments
+NPM_CACHE_DIR = os.getenv("NPM_CACHE_DIR")
+
+# Background executor for clone-and-deploy jobs
+EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("MAX_DEPLOY_JOBS", "4")))
+
+# Background executor for process-github downloads
+DOWNLOAD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("MAX_DOWNLOAD_JOBS", "8"))
+)
+
+# Cap on concurrent git/npm builds across all server processes so they don't
+# thrash disk and memory; further jobs wait for a free slot
+MAX_CONCURRENT_BUILDS = int(
+    os.getenv("MAX_CONCURRENT_BUILDS", max(1, (os.cpu_count() or 2) // 2))
+)
+if MAX_CONCURRENT_BUILDS < 1:
+    raise ValueError("MAX_CONCURRENT_BUILDS must be at least 1")
+
+# Seconds between checks for a free build slot
+BUILD_SLOT_POLL_INTERVAL = 1
+
+# Precompiled GitHub URL patterns
+_REPO_RE = re.compile(r"^https?://github\.com/[\w-]+/[\w.-]+/?$")
+_HTML_SNIFF_RE = re.compile(rb"<!doctype html|<html", re.IGNORECASE)
+_GH_URL_RE = re.compile(
+    r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)/(?P<kind>blob|tree)/"
+    r"(?P<branch>[^/]+)/(?P<path>[^?#]+?)/?(?:[?#].*)?$"
+)
+_GITHUB_PREFIXES = ("https://github.com/", "http://github.com/")
+_RAW_PREFIXES = (
+    "https://raw.githubusercontent.com/",
+    "http://raw.githubusercontent.com/",
+)
+_ALLOWED_PREFIXES = _GITHUB_PREFIXES + _RAW_PREFIXES
+
 # Print configuration for debugging
-logger.info(f"LOCAL_DESTINATION: {LOCAL_DESTINATION}")
+logger.info("LOCAL_DESTINATION: %s", LOCAL_DESTINATION)
+
+# Create the destination, cache and log directories once at startup
+try:
+    for directory in (LOCAL_DESTINATION, CACHE_DIR, LOG_DIR, JOBS_DIR):
+        os.makedirs(directory, exist_ok=True)
+except OSError as e:
+    logger.error("Could not create %s: %s", directory, e)
 
 
 @app.route("/api/process-github", methods=["POST"])
 def process_github():
-    data = request.json
-    if not data or "github_url" not in data:
+    try:
+        payload = msgspec.json.decode(request.get_data(), type=ProcessGithubRequest)
+    except msgspec.MsgspecError as e:
         return (
             jsonify(
                 {
                     "error": "GitHub URL is required",
+                    "details": str(e),
                     "example": "https://github.com/username/repo/blob/main/path/to/file.txt",
                 }
             ),
             400,
         )
 
-    github_url = data["github_url"]
-    logger.info(f"Processing GitHub URL: {github_url}")
+    github_url = payload.github_url
+    logger.info("Processing GitHub URL: %s", github_url)
 
-    # Convert GitHub URL to raw content URL if needed
-    raw_url = convert_to_raw_url(github_url)
+    # Reject non-GitHub hosts with a prefix check, then convert GitHub URL to raw
+    # content URL if needed
+    raw_url = None
+    if github_url.startswith(_ALLOWED_PREFIXES):
+        raw_url = convert_to_raw_url(github_url)
     if not raw_url:
         return (
             jsonify(
@@ -57,93 +273,126 @@ def process_github():
             400,
         )
 
-    try:
-        # Fetch content from GitHub
-        logger.info(f"Fetching content from URL: {raw_url}")
-        response = requests.get(raw_url)
-        response.raise_for_status()
+    # Get filename from URL
+    filename = url_filename(raw_url)
+    logger.info("Extracted filename: %s", filename)
+    if not is_safe_name(filename):
+        return (
+            jsonify({"error": "Invalid file name in GitHub URL", "provided": github_url}),
+            400,
+        )
 
-        # Check if content is binary or text
-        content_type = response.headers.get("content-type", "")
-        logger.info(f"Content-Type: {content_type}")
+    # Download in the background so the request returns immediately
+    job_id = uuid.uuid4().hex
+    prune_jobs()
 
-        # Detect HTML content (which would indicate we're not getting raw file content)
-        if content_type.startswith("text/html"):
-            logger.error("Received HTML content instead of raw file content")
-            return (
-                jsonify(
-                    {
-                        "error": "Received HTML instead of file content. Please use a direct link to a raw file."
-                    }
-                ),
-                400,
-            )
+    # The job holds a lock of its own from now until it records its outcome,
+    # so it can be told apart from a job whose process died
+    lock_fd = try_lock(download_lock_path(job_id))
+    try:
+        write_job(job_id, {"status": "queued", "started_at": time.time()})
+        DOWNLOAD_EXECUTOR.submit(run_download_job, job_id, lock_fd, raw_url, filename)
+    except Exception:
+        os.close(lock_fd)
+        raise
+    logger.info("Started download job %s for %s", job_id, raw_url)
 
-        # Additional check - look for HTML tags in content
-        content_preview = response.content[:1000].decode("utf-8", errors="ignore")
-        if "<!DOCTYPE html>" in content_preview or "<html" in content_preview:
-            logger.error("Content appears to be HTML based on content inspection")
-            return (
-                jsonify(
-                    {
-                        "error": "Received HTML instead of file content. Please use a direct link to a raw file."
-                    }
-                ),
-                400,
-            )
+    return (
+        jsonify(
+            {
+                "message": "Download started",
+                "job_id": job_id,
+                "status_url": f"/api/jobs/{job_id}",
+            }
+        ),
+        202,
+    )
 
-        # Determine if content is binary or text
-        is_binary = not (
-            content_type.startswith("text/")
-            or content_type.startswith("application/json")
-            or content_type.startswith("application/xml")
-        )
 
-        # Get content as binary or text
-        file_content = response.content if is_binary else response.text
+@app.route("/api/process-github-batch", methods=["POST"])
+def process_github_batch():
+    try:
+        payload = msgspec.json.decode(
+            request.get_data(), type=ProcessGithubBatchRequest
+        )
+    except msgspec.MsgspecError as e:
+        return (
+            jsonify(
+                {
+                    "error": "A list of 1 to 50 GitHub URLs is required",
+                    "details": str(e),
+                    "example": [
+                        "https://github.com/username/repo/blob/main/path/to/file.txt"
+                    ],
+                }
+            ),
+            400,
+        )
 
-        # Get filename from URL
-        filename = os.path.basename(urlparse(raw_url).path)
-        logger.info(f"Extracted filename: {filename}")
+    github_urls = payload.github_urls
+    logger.info("Processing batch of %s GitHub URLs", len(github_urls))
 
-        # Save file locally
-        success, message = save_file_locally(file_content, filename)
+    # Reject invalid URLs and URLs that would save over another file of the
+    # batch up front, and download the rest concurrently
+    results = {}
+    raw_urls = {}
+    filenames = set()
+    for github_url in github_urls:
+        if github_url in results or github_url in raw_urls:
+            # Repeated URLs share one download and one result
+            continue
 
-        if success:
-            return (
-                jsonify(
-                    {"message": f"Successfully saved {filename} to local destination"}
-                ),
-                200,
-            )
+        raw_url = None
+        if github_url.startswith(_ALLOWED_PREFIXES):
+            raw_url = convert_to_raw_url(github_url)
+        if not raw_url:
+            results[github_url] = {
+                "github_url": github_url,
+                "error": "Invalid GitHub URL format. Please provide a direct link to a file.",
+            }
+        elif url_filename(raw_url) in filenames:
+            results[github_url] = {
+                "github_url": github_url,
+                "error": "Another URL in this batch saves to the same file name",
+            }
         else:
-            return jsonify({"error": message}), 500
+            raw_urls[github_url] = raw_url
+            filenames.add(url_filename(raw_url))
 
-    except requests.exceptions.RequestException as e:
-        return jsonify({"error": f"Failed to fetch GitHub content: {str(e)}"}), 500
+    try:
+        fetched = asyncio.run(fetch_batch(list(raw_urls.values())))
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
+    for github_url, result in zip(raw_urls, fetched):
+        results[github_url] = {"github_url": github_url, **result}
+
+    return jsonify({"results": [results[url] for url in github_urls]}), 200
+
 
 @app.route("/api/clone-and-deploy", methods=["POST"])
 def clone_and_deploy():
-    data = request.json
-    if not data or "github_url" not in data or "project_name" not in data:
+    try:
+        payload = msgspec.json.decode(request.get_data(), type=CloneAndDeployRequest)
+    except msgspec.MsgspecError as e:
         return (
             jsonify(
                 {
                     "error": "GitHub URL and project name are required",
+                    "details": str(e),
                     "example": "https://github.com/username/repo",
                 }
             ),
             400,
         )
 
-    github_url = data["github_url"]
-    project_name = data["project_name"]
+    github_url = payload.github_url
+    project_name = payload.project_name
 
-    # Validate GitHub URL format
-    if not is_valid_github_repo_url(github_url):
+    # Validate GitHub URL format, rejecting other hosts before the regex runs
+    if not github_url.startswith(_GITHUB_PREFIXES) or not is_valid_github_repo_url(
+        github_url
+    ):
         return (
             jsonify(
                 {
@@ -154,187 +403,840 @@ def clone_and_deploy():
             400,
         )
 
-    try:
-        # Clone repository locally
-        success, message = clone_repo_locally(github_url, project_name)
+    # Only allow plain directory names inside the local destination
+    if not is_safe_name(project_name) or project_name.startswith("."):
+        return (
+            jsonify(
+                {
+                    "error": "Invalid project name",
+                    "provided": project_name,
+                }
+            ),
+            400,
+        )
 
-        if success:
-            # Extract username and repo name from GitHub URL
-            parsed_url = urlparse(github_url)
-            path_parts = parsed_url.path.strip("/").split("/")
-            username = path_parts[0]
-            repo_name = path_parts[1]
+    try:
+        # Extract username and repo name from the validated
+        # http(s)://github.com/{username}/{repo_name} URL
+        username, repo_name = github_url.split("/", 5)[3:5]
 
-            # Generate GitHub Pages URL (just for compatibility with old code)
-            pages_url = f"https://{username}.github.io/{repo_name}"
+        # Generate GitHub Pages URL (just for compatibility with old code)
+        pages_url = f"https://{username}.github.io/{repo_name}"
 
+        # Only one deployment per project may run across all server processes;
+        # the job holds the project's lock until it finishes or its process dies
+        lock_fd = try_lock(os.path.join(JOBS_DIR, f"{project_name}.lock"))
+        if lock_fd is None:
             return (
                 jsonify(
                     {
-                        "message": "Repository cloned successfully",
-                        "deployment_url": pages_url,
-                        "details": message,
+                        "error": "A deployment for this project is already running",
+                        "job_id": read_project_job(project_name),
                     }
                 ),
-                200,
+                409,
             )
-        else:
-            return jsonify({"error": message}), 500
+
+        # Clone repository in the background so the request returns immediately
+        try:
+            job_id = uuid.uuid4().hex
+            prune_jobs()
+            write_project_job(project_name, job_id)
+            write_job(
+                job_id,
+                {
+                    "status": "queued",
+                    "project_name": project_name,
+                    "started_at": time.time(),
+                },
+            )
+            EXECUTOR.submit(
+                run_deploy_job, job_id, lock_fd, github_url, project_name, pages_url
+            )
+        except Exception:
+            os.close(lock_fd)
+            raise
+        logger.info("Started deploy job %s for %s", job_id, github_url)
+
+        return (
+            jsonify(
+                {
+                    "message": "Deployment started",
+                    "job_id": job_id,
+                    "status_url": f"/api/jobs/{job_id}",
+                }
+            ),
+            202,
+        )
 
     except Exception as e:
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
 
 
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    state = read_job(job_id) if is_safe_name(job_id) else None
+    if state is None:
+        return jsonify({"error": "Unknown job ID", "job_id": job_id}), 404
+
+    # A job is written as finished before it lets go of its worker, so read it
+    # again before declaring it dead
+    if not is_job_finished(state) and not is_job_alive(job_id, state):
+        state = read_job(job_id) or state
+        if not is_job_finished(state):
+            state = {
+                **state,
+                "status": "failed",
+                "error": "The job was interrupted before it finished",
+            }
+
+    return jsonify({"job_id": job_id, **state}), 200
+
+
+@app.route("/api/files/<path:filename>", methods=["GET"])
+def get_file(filename):
+    # Never serve the download cache, other hidden files or paths outside
+    # the local destination directory
+    path = safe_join(LOCAL_DESTINATION, filename)
+    hidden = any(part.startswith(".") for part in filename.split("/"))
+    if hidden or path is None or not os.path.isfile(path):
+        return jsonify({"error": "File not found"}), 404
+
+    if X_ACCEL_REDIRECT_PREFIX:
+        # nginx streams the file itself; Flask only sends the headers
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        response = app.response_class(mimetype=mimetype)
+        # nginx expects a percent-encoded URI, and header values must be latin-1
+        response.headers["X-Accel-Redirect"] = (
+            X_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(filename)
+        )
+        return response
+
+    return send_from_directory(LOCAL_DESTINATION, filename)
+
+
+def run_deploy_job(job_id, lock_fd, github_url, project_name, pages_url):
+    """Clone a repository and record the outcome for the jobs endpoint.
+
+    ``lock_fd`` holds the project's deploy lock and is closed once the outcome
+    is recorded.
+    """
+    try:
+        with build_slot():
+            write_job(
+                job_id,
+                {
+                    "status": "running",
+                    "project_name": project_name,
+                    "started_at": time.time(),
+                },
+            )
+            success, message = asyncio.run(
+                clone_repo_locally(github_url, project_name)
+            )
+
+        if success:
+            write_job(
+                job_id,
+                {
+                    "status": "succeeded",
+                    "message": "Repository cloned successfully",
+                    "deployment_url": pages_url,
+                    "details": message,
+                },
+            )
+        else:
+            write_job(job_id, {"status": "failed", "error": message})
+    finally:
+        os.close(lock_fd)
+
+
+def run_download_job(job_id, lock_fd, raw_url, filename):
+    """Download a file and record the outcome for the jobs endpoint.
+
+    ``lock_fd`` holds the job's lock and is released once the outcome is
+    recorded.
+    """
+    try:
+        write_job(job_id, {"status": "running", "started_at": time.time()})
+        state = download_github_file(raw_url, filename)
+        write_job(job_id, state)
+
+        # Trim the cache only once the outcome is recorded, so an eviction
+        # problem can never turn a saved file into a failed job
+        if state["status"] == "succeeded":
+            try:
+                evict_cache()
+            except OSError as e:
+                logger.warning("Could not evict cache entries: %s", e)
+    finally:
+        release_lock(download_lock_path(job_id), lock_fd)
+
+
+def download_github_file(raw_url, filename):
+    """Fetch a raw GitHub file into the local destination, using the cache."""
+    try:
+        # Serve recently fetched files straight from the cache
+        key = cache_key(raw_url)
+        cached = load_cache_meta(key)
+        if cached and time.time() - cached["fetched_at"] < CACHE_TTL:
+            logger.info("Cache hit for %s, skipping download", raw_url)
+            success, message = restore_from_cache(key, filename)
+            return save_result(success, message, filename)
+
+        # Revalidate stale cache entries instead of downloading them again
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        # Probe uncached URLs with a HEAD on the same pooled connection, so error
+        # and HTML pages are rejected without transferring their body
+        if not cached:
+            probe = SESSION.head(raw_url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
+            if probe.status_code not in (405, 501):
+                probe.raise_for_status()
+                if probe.headers.get("content-type", "").startswith("text/html"):
+                    logger.error("HEAD reported HTML content for %s", raw_url)
+                    return {
+                        "status": "failed",
+                        "error": "Received HTML instead of file content. Please use a direct link to a raw file.",
+                    }
+
+        # Fetch content from GitHub
+        logger.info("Fetching content from URL: %s", raw_url)
+        with SESSION.get(
+            raw_url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT
+        ) as response:
+            if response.status_code == 304:
+                logger.info("%s not modified, using cached copy", raw_url)
+                cached["fetched_at"] = time.time()
+                write_cache_meta(key, cached)
+                success, message = restore_from_cache(key, filename)
+                return save_result(success, message, filename)
+
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            logger.info("Content-Type: %s", content_type)
+
+            # Detect HTML content (which would indicate we're not getting raw file
+            # content) from the content type or the tags at the start of the body,
+            # so the rest of the body is never pulled into memory
+            response.raw.decode_content = True
+            # urllib3 1.x otherwise treats a body cut short as complete
+            response.raw.enforce_content_length = True
+            head = response.raw.read(SNIFF_SIZE)
+            if is_html_content(content_type, head):
+                logger.error("Received HTML content instead of raw file content")
+                return {
+                    "status": "failed",
+                    "error": "Received HTML instead of file content. Please use a direct link to a raw file.",
+                }
+
+            # Stream the file into this URL's own cache entry, starting with the
+            # bytes already read, then place that entry at the destination
+            success, message = store_in_cache(
+                key, response.raw, head, response.headers
+            )
+
+        if success:
+            success, message = restore_from_cache(key, filename)
+        return save_result(success, message, filename)
+
+    except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+        # Errors while streaming response.raw surface as urllib3 exceptions
+        return {
+            "status": "failed",
+            "error": f"Failed to fetch GitHub content: {str(e)}",
+        }
+    except Exception as e:
+        return {"status": "failed", "error": f"An error occurred: {str(e)}"}
+
+
+def write_job(job_id, state):
+    """Atomically persist the state of a deploy job."""
+    path = os.path.join(JOBS_DIR, f"{job_id}.json")
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(state, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def read_job(job_id):
+    """Load the state of a deploy job, or None if the job is unknown."""
+    try:
+        with open(os.path.join(JOBS_DIR, f"{job_id}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def prune_jobs():
+    """Delete job states last updated more than JOB_RETENTION seconds ago."""
+    global _last_job_prune
+    now = time.time()
+    if now - _last_job_prune < JOB_PRUNE_INTERVAL:
+        return
+    _last_job_prune = now
+
+    for entry in os.scandir(JOBS_DIR):
+        try:
+            if entry.name.endswith(".json") and (
+                now - entry.stat().st_mtime > JOB_RETENTION
+            ):
+                os.remove(entry.path)
+        except FileNotFoundError:
+            # Another server process pruned it first
+            pass
+
+
+def is_job_finished(state):
+    """Return whether a job state records the outcome of the job."""
+    return state["status"] in ("succeeded", "failed")
+
+
+def is_job_alive(job_id, state):
+    """Return whether an unfinished job still has a worker behind it."""
+    project_name = state.get("project_name")
+    if project_name is None:
+        # Download jobs hold a lock of their own for as long as they run
+        lock_path = download_lock_path(job_id)
+        lock_fd = try_lock(lock_path)
+        if lock_fd is None:
+            return True
+        release_lock(lock_path, lock_fd)
+        return False
+
+    # Deploy jobs hold their project's lock for as long as they run
+    if read_project_job(project_name) != job_id:
+        return False
+    lock_fd = try_lock(os.path.join(JOBS_DIR, f"{project_name}.lock"))
+    if lock_fd is None:
+        return True
+    os.close(lock_fd)
+    return False
+
+
+@contextmanager
+def build_slot():
+    """Hold one of the build slots shared by all server processes."""
+    while True:
+        for slot in range(MAX_CONCURRENT_BUILDS):
+            # Project names can't start with a dot, so these never collide
+            # with project locks
+            lock_fd = try_lock(os.path.join(JOBS_DIR, f".build-{slot}.lock"))
+            if lock_fd is not None:
+                try:
+                    yield
+                finally:
+                    os.close(lock_fd)
+                return
+        time.sleep(BUILD_SLOT_POLL_INTERVAL)
+
+
+def download_lock_path(job_id):
+    """Return the path of the lock held by a running download job."""
+    # Project names can't start with a dot, so this never collides with a
+    # project lock
+    return os.path.join(JOBS_DIR, f".{job_id}.lock")
+
+
+def release_lock(path, fd):
+    """Delete a single-use lock file and release the lock held on it."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    os.close(fd)
+
+
+def try_lock(path):
+    """Open and exclusively lock a lock file without blocking.
+
+    Returns the open descriptor, which keeps the lock until it is closed or
+    its process exits, or None if the lock is held elsewhere.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def write_project_job(project_name, job_id):
+    """Atomically record the latest deploy job of a project."""
+    path = os.path.join(JOBS_DIR, f"{project_name}.project")
+    with open(f"{path}.tmp", "w") as f:
+        f.write(job_id)
+    os.replace(f"{path}.tmp", path)
+
+
+def read_project_job(project_name):
+    """Return the latest deploy job ID of a project, if any."""
+    try:
+        with open(os.path.join(JOBS_DIR, f"{project_name}.project")) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 def convert_to_raw_url(github_url):
     """Convert a GitHub URL to a raw content URL."""
-    parsed = urlparse(github_url)
+    logger.info("Converting GitHub URL: %s", github_url)
+
+    raw_url, kind = parse_github_url(github_url)
+    if kind == "foreign":
+        logger.warning("URL is not from GitHub: %s", github_url)
+    elif kind == "raw":
+        logger.info("Already a raw URL, using as is")
+    elif kind == "unparsed":
+        logger.warning("Could not parse GitHub URL format: %s", github_url)
+    elif kind == "tree":
+        logger.error(
+            "GitHub URL points to a directory, not a file. Please provide a direct link to a file."
+        )
+    else:
+        logger.info("Converted blob URL to raw URL: %s", raw_url)
+    return raw_url
+
 
-    logger.info(f"Converting GitHub URL: {github_url}")
+@lru_cache(maxsize=1024)
+def parse_github_url(github_url):
+    """Map a GitHub URL to (raw URL or None, kind of URL it was)."""
+    # If the URL is not from GitHub or raw.githubusercontent.com, it's invalid;
+    # reject it before any parsing
+    if not github_url.startswith(_ALLOWED_PREFIXES):
+        return None, "foreign"
 
     # Already a raw URL
-    if parsed.netloc == "raw.githubusercontent.com":
-        logger.info("Already a raw URL, using as is")
-        return github_url
+    if github_url.startswith(_RAW_PREFIXES):
+        return github_url, "raw"
 
     # Normal GitHub URL
-    if parsed.netloc == "github.com":
-        path_parts = parsed.path.strip("/").split("/")
-
-        # Check for 'blob' pattern (direct file)
-        if len(path_parts) >= 5 and path_parts[2] == "blob":
-            # Format: github.com/{owner}/{repo}/blob/{branch}/{path}
-            owner = path_parts[0]
-            repo = path_parts[1]
-            branch = path_parts[3]
-            file_path = "/".join(path_parts[4:])
-            raw_url = (
-                f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file_path}"
-            )
-            logger.info(f"Converted blob URL to raw URL: {raw_url}")
-            return raw_url
-
-        # Check for 'tree' pattern (directory)
-        elif len(path_parts) >= 5 and path_parts[2] == "tree":
-            # Directory URLs can't be directly converted to raw content
-            logger.error(
-                "GitHub URL points to a directory, not a file. Please provide a direct link to a file."
-            )
-            return None
+    # Format: github.com/{owner}/{repo}/{blob|tree}/{branch}/{path}
+    match = _GH_URL_RE.match(github_url)
+    if not match:
+        # Return None instead of the original URL to prevent downloading HTML
+        return None, "unparsed"
 
-        logger.warning(f"Could not parse GitHub URL format: {github_url}")
-        return (
-            None  # Return None instead of the original URL to prevent downloading HTML
+    if match["kind"] == "tree":
+        # Directory URLs can't be directly converted to raw content
+        return None, "tree"
+
+    owner, repo, branch, file_path = match.group("owner", "repo", "branch", "path")
+    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file_path}"
+    return raw_url, "blob"
+
+
+async def fetch_batch(raw_urls):
+    """Download several raw GitHub files concurrently over one HTTP/2 client."""
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+        limits=httpx.Limits(max_connections=20),
+    ) as client:
+        return await asyncio.gather(
+            *(fetch_to_disk(client, raw_url) for raw_url in raw_urls)
         )
 
-    # If the URL is not from GitHub or raw.githubusercontent.com, it's probably invalid
-    logger.warning(f"URL is not from GitHub: {github_url}")
-    return None
 
+async def fetch_to_disk(client, raw_url):
+    """Stream one raw GitHub file to the local destination directory."""
+    filename = url_filename(raw_url)
+    if not is_safe_name(filename):
+        return {"error": "Invalid file name in GitHub URL"}
 
-def save_file_locally(file_content, filename):
-    """Save file content to the local destination directory."""
     try:
-        # Ensure the destination directory exists
-        os.makedirs(LOCAL_DESTINATION, exist_ok=True)
-        
-        # Construct the full destination path
-        destination = os.path.join(LOCAL_DESTINATION, filename)
-        logger.info(f"Saving file to: {destination}")
-        
-        # Determine write mode based on content type
-        is_binary = isinstance(file_content, bytes)
-        write_mode = "wb" if is_binary else "w"
-        
-        # Write the file
-        with open(destination, write_mode) as f:
-            f.write(file_content)
-            
-        logger.info(f"File successfully saved to {destination}")
+        logger.info("Fetching content from URL: %s", raw_url)
+        async with client.stream("GET", raw_url) as response:
+            response.raise_for_status()
+
+            # Detect HTML pages from the first chunk before writing anything
+            content_type = response.headers.get("content-type", "")
+            chunks = response.aiter_bytes(COPY_BUFFER_SIZE)
+            try:
+                head = await chunks.__anext__()
+            except StopAsyncIteration:
+                head = b""
+            if is_html_content(content_type, head):
+                logger.error(
+                    "Received HTML content instead of file content: %s", raw_url
+                )
+                return {
+                    "error": "Received HTML instead of file content. Please use a direct link to a raw file."
+                }
+
+            destination = _DEST_PREFIX + filename
+            logger.info("Saving file to: %s", destination)
+            with replace_atomically(destination) as f:
+                f.write(head)
+                async for chunk in chunks:
+                    f.write(chunk)
+
+        logger.info("File successfully saved to %s", destination)
+        return {
+            "filename": filename,
+            "message": f"Successfully saved {filename} to local destination",
+        }
+
+    except httpx.HTTPError as e:
+        logger.error("Failed to fetch %s: %s", raw_url, e)
+        return {"error": f"Failed to fetch GitHub content: {str(e)}"}
+    except Exception as e:
+        logger.error("Error saving %s: %s", filename, e)
+        return {"error": f"An error occurred: {str(e)}"}
+
+
+def url_filename(url):
+    """Return the last path segment of a URL, without query or fragment."""
+    return url.rpartition("/")[2].partition("?")[0].partition("#")[0]
+
+
+def is_safe_name(name):
+    """Return whether a file or project name is a single path component."""
+    return (
+        isinstance(name, str)
+        and name not in ("", ".", "..")
+        and "/" not in name
+        and "\\" not in name
+    )
+
+
+def is_html_content(content_type, head):
+    """Return whether a response is an HTML page rather than raw file content."""
+    return content_type.startswith("text/html") or bool(
+        _HTML_SNIFF_RE.search(head, 0, 512)
+    )
+
+
+def save_file_locally(source, destination, head=b""):
+    """Stream a binary file-like object to a path on the local disk.
+
+    ``head`` holds bytes already read from ``source`` and is written first.
+    Errors raised while reading ``source`` propagate to the caller.
+    """
+    logger.info("Saving file to: %s", destination)
+    try:
+        with replace_atomically(destination) as f:
+            f.write(head)
+            shutil.copyfileobj(source, f, COPY_BUFFER_SIZE)
+    except OSError as e:
+        if isinstance(e, requests.exceptions.RequestException):
+            raise
+        logger.error("Error saving file locally: %s", e)
+        return False, f"Error saving file locally: {str(e)}"
+
+    logger.info("File successfully saved to %s", destination)
+    return True, f"File saved successfully to {destination}"
+
+
+@contextmanager
+def replace_atomically(destination):
+    """Open a hidden temp file that replaces ``destination`` once complete.
+
+    The temp file is removed if the block fails, so a failed write never
+    truncates the previous copy of ``destination``.
+    """
+    f = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(destination), prefix=".", suffix=".part", delete=False
+    )
+    try:
+        with f:
+            # Temp files start out private; give the file the usual permissions
+            os.chmod(f.name, FILE_MODE)
+            yield f
+        os.replace(f.name, destination)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+
+def save_result(success, message, filename):
+    """Build the job state for a file save attempt."""
+    if success:
+        return {
+            "status": "succeeded",
+            "message": f"Successfully saved {filename} to local destination",
+        }
+    return {"status": "failed", "error": message}
+
+
+def cache_key(raw_url):
+    """Return the cache key for a raw GitHub URL."""
+    return hashlib.sha256(raw_url.encode()).hexdigest()
+
+
+def load_cache_meta(key):
+    """Load the cached metadata for a key, or None if nothing usable is cached."""
+    meta_path = os.path.join(CACHE_DIR, f"{key}.meta")
+    blob_path = os.path.join(CACHE_DIR, f"{key}.blob")
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not os.path.exists(blob_path):
+        return None
+
+    # Mark the entry as recently used for eviction; another server process
+    # may have evicted it since it was read
+    try:
+        os.utime(meta_path)
+    except FileNotFoundError:
+        return None
+    return meta
+
+
+def write_cache_meta(key, meta):
+    """Atomically persist the metadata for a cache entry."""
+    meta_path = os.path.join(CACHE_DIR, f"{key}.meta")
+    # Several downloads of one URL may write its entry at once
+    tmp_path = f"{meta_path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def store_in_cache(key, source, head, headers):
+    """Stream a download into the cache entry of its URL with its validators."""
+    blob_path = os.path.join(CACHE_DIR, f"{key}.blob")
+    success, message = save_file_locally(source, blob_path, head)
+    if success:
+        write_cache_meta(
+            key,
+            {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            },
+        )
+    return success, message
+
+
+def evict_cache():
+    """Remove the least recently used entries beyond CACHE_MAX_ENTRIES."""
+    # Every thread and server process evicts from the same cache, so entries
+    # may vanish at any point
+    metas = []
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith(".meta"):
+            try:
+                metas.append((entry.stat().st_mtime, entry.name))
+            except FileNotFoundError:
+                pass
+    if len(metas) <= CACHE_MAX_ENTRIES:
+        return
+
+    metas.sort()
+    for _, name in metas[: len(metas) - CACHE_MAX_ENTRIES]:
+        key = name[: -len(".meta")]
+        logger.info("Evicting cache entry %s", key)
+        for suffix in (".meta", ".blob"):
+            try:
+                os.remove(os.path.join(CACHE_DIR, key + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def restore_from_cache(key, filename):
+    """Place a cached file in the local destination directory."""
+    destination = _DEST_PREFIX + filename
+    tmp_path = os.path.join(LOCAL_DESTINATION, f".{uuid.uuid4().hex}.part")
+    try:
+        logger.info("Restoring cached file to: %s", destination)
+        # Hard-link the blob (copy it across file systems) under a temp name and
+        # swap that in, so the destination is never seen half-written
+        blob_path = os.path.join(CACHE_DIR, f"{key}.blob")
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            shutil.copyfile(blob_path, tmp_path)
+        os.replace(tmp_path, destination)
         return True, f"File saved successfully to {destination}"
-    
+
     except Exception as e:
-        logger.error(f"Error saving file locally: {str(e)}")
+        logger.error("Error restoring cached file: %s", e)
         return False, f"Error saving file locally: {str(e)}"
 
+    finally:
+        # rename(2) leaves both names in place when the destination already
+        # links to the same blob
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
 
+@lru_cache(maxsize=1024)
 def is_valid_github_repo_url(url):
     """Validate GitHub repository URL format."""
-    pattern = r"^https?://github\.com/[\w-]+/[\w.-]+/?$"
-    return bool(re.match(pattern, url))
+    return _REPO_RE.match(url) is not None
+
+
+def has_entries(path):
+    """Return whether a directory exists and contains at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def remove_readonly(func, path, exc_info):
+    """Make a read-only path writable and retry the failed removal."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def kill_process_tree(process):
+    """Kill a process started in its own session along with its children."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def run_logged_command(argv, cwd, env, log_path):
+    """Run a command with its output appended to a log file.
+
+    Returns the exit code and the tail of the command's output.
+    """
+    with open(log_path, "ab") as log:
+        start = os.fstat(log.fileno()).st_size
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
+            env=env,
+            stdout=log,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
+        )
+        try:
+            returncode = await asyncio.wait_for(process.wait(), COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            kill_process_tree(process)
+            await process.wait()
+            raise RuntimeError(
+                f"{' '.join(argv[:2])} timed out after {COMMAND_TIMEOUT} seconds"
+            )
+        end = os.fstat(log.fileno()).st_size
+
+    # Only the end of the output is kept in memory for error messages
+    with open(log_path, "rb") as log:
+        log.seek(max(start, end - LOG_TAIL_SIZE))
+        output = log.read(end - log.tell()).decode("utf-8", errors="replace")
+
+    return returncode, output
 
 
-def clone_repo_locally(github_url, project_name):
+async def clone_repo_locally(github_url, project_name):
     """Clone repository locally."""
     try:
         # Create project directory
-        project_dir = os.path.join(LOCAL_DESTINATION, project_name)
-        logger.info(f"Cloning repository to: {project_dir}")
+        project_dir = _DEST_PREFIX + project_name
+        logger.info("Cloning repository to: %s", project_dir)
+        
+        # Clear out a previous deployment in a single pass
+        if has_entries(project_dir):
+            logger.warning("Directory %s is not empty, clearing it", project_dir)
+            shutil.rmtree(project_dir, onerror=remove_readonly)
         
         # Create directory if it doesn't exist
         os.makedirs(project_dir, exist_ok=True)
         
-        # Check if directory is empty
-        if os.listdir(project_dir):
-            logger.warning(f"Directory {project_dir} is not empty, clearing it")
-            # Clear directory content
-            for item in os.listdir(project_dir):
-                item_path = os.path.join(project_dir, item)
-                if os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-                else:
-                    os.remove(item_path)
+        # Command output goes to a per-project log instead of memory
+        log_path = os.path.join(LOG_DIR, f"{project_name}.log")
+        open(log_path, "wb").close()
+        logger.info("Writing command output to: %s", log_path)
         
-        # Clone the repository
-        result = subprocess.run(
-            ["git", "clone", github_url, "."],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=False
+        # Fail fast on private repositories instead of prompting for credentials
+        git_env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+        # Clone only the tip of the default branch; deployment needs no history
+        returncode, output = await run_logged_command(
+            [
+                "git",
+                "clone",
+                "--depth=1",
+                "--single-branch",
+                "--filter=blob:none",
+                github_url,
+                ".",
+            ],
+            project_dir,
+            git_env,
+            log_path,
         )
         
-        if result.returncode != 0:
-            logger.error(f"Git clone failed: {result.stderr}")
-            return False, f"Git clone failed: {result.stderr}"
+        # Dumb HTTP servers support neither shallow nor partial clones
+        if returncode != 0 and "dumb http" in output.lower():
+            logger.warning("Shallow clone not supported, falling back to full clone")
+            returncode, output = await run_logged_command(
+                ["git", "clone", github_url, "."], project_dir, git_env, log_path
+            )
+        
+        if returncode != 0:
+            logger.error("Git clone failed: %s", output)
+            return False, f"Git clone failed: {output}"
         
-        logger.info(f"Repository cloned successfully to {project_dir}")
+        logger.info("Repository cloned successfully to %s", project_dir)
         
         # Try to run npm install if package.json exists
         if os.path.exists(os.path.join(project_dir, "package.json")):
-            logger.info("package.json found, running npm install")
-            npm_result = subprocess.run(
-                ["npm", "install"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                check=False
+            # A lockfile lets npm ci skip dependency resolution entirely
+            if os.path.exists(os.path.join(project_dir, "package-lock.json")):
+                npm_command = ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"]
+            else:
+                npm_command = ["npm", "install", "--no-audit", "--no-fund"]
+            
+            # Suppress interactive prompts and share the npm cache across deploys
+            npm_env = {**os.environ, "CI": "1"}
+            if NPM_CACHE_DIR:
+                npm_env["NPM_CONFIG_CACHE"] = NPM_CACHE_DIR
+            
+            logger.info("package.json found, running %s", " ".join(npm_command))
+            npm_returncode, npm_output = await run_logged_command(
+                npm_command, project_dir, npm_env, log_path
             )
             
-            if npm_result.returncode != 0:
-                logger.warning(f"npm install warning: {npm_result.stderr}")
+            if npm_returncode != 0:
+                logger.warning("npm %s warning: %s", npm_command[1], npm_output)
             else:
-                logger.info("npm install completed successfully")
+                logger.info("npm %s completed successfully", npm_command[1])
         
         return True, f"Repository cloned successfully to {project_dir}"
     
     except Exception as e:
-        logger.error(f"Error cloning repository: {str(e)}")
+        logger.error("Error cloning repository: %s", e)
         return False, f"Error cloning repository: {str(e)}"
 
 
 # Add application-level error handler
 @app.errorhandler(500)
 def internal_error(error):
-    import traceback
-
-    logger.error(f"500 error: {error}")
+    logger.error("500 error: %s", error)
     logger.error(traceback.format_exc())
     return jsonify({"error": "Internal server error", "details": str(error)}), 500
 
 
 if __name__ == "__main__":
+    # Development server only; production runs under gunicorn -c gunicorn_conf.py
+    # Debug mode stays on unless FLASK_DEBUG turns it off, as Flask reads it
+    debug = os.getenv("FLASK_DEBUG", "1").lower() not in ("0", "false", "no")
     logger.info("========================= STARTING SERVER =========================")
-    logger.info(f"Configuration: LOCAL_DESTINATION={LOCAL_DESTINATION}")
+    logger.info("Configuration: LOCAL_DESTINATION=%s", LOCAL_DESTINATION)
     logger.info("Make sure LOCAL_DESTINATION directory exists and has write permissions")
+    if not debug:
+        logger.warning("Use gunicorn -c gunicorn_conf.py app:app in production")
     logger.info("==================================================================")
-    app.run(debug=True, host="0.0.0.0", port=5000)
\ No newline at end of file
+    app.run(debug=debug, host="0.0.0.0", port=5000)
\ No newline at end of file
@@ -0,0 +1,17 @@
+import os
+
+# Same address and port as the development server
+bind = os.getenv("BIND", "0.0.0.0:5000")
+
+# Requests spend their time waiting on GitHub, git and npm, so run several
+# processes with a pool of threads each
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 2) * 2 + 1))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Allow slow downloads to finish before a worker is restarted
+timeout = 120
+
+# Keep worker heartbeat files in memory instead of on disk
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
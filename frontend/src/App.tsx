@@ -26,9 +26,9 @@ function App() {
     setResponse(null);
 
     try {
-      const backendUrl = 'http://localhost:5000/api/clone-and-deploy';
+      const backendUrl = 'http://localhost:5000';
 
-      const response = await fetch(backendUrl, {
+      const response = await fetch(`${backendUrl}/api/clone-and-deploy`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -39,7 +39,26 @@ function App() {
         }),
       });
 
-      const data = await response.json();
+      let data = await response.json();
+
+      // The deployment runs in the background; poll its job until it finishes
+      if (response.status === 202) {
+        while (data.status !== 'succeeded' && data.status !== 'failed') {
+          await new Promise((resolve) => setTimeout(resolve, 2000));
+          const jobResponse = await fetch(`${backendUrl}${data.status_url}`);
+          const jobData = await jobResponse.json();
+          if (!jobResponse.ok) {
+            data = { status: 'failed', error: jobData.error };
+            break;
+          }
+          data = { ...jobData, status_url: data.status_url };
+        }
+
+        if (data.status === 'failed') {
+          setResponse({ success: false, error: data.error });
+          return;
+        }
+      }
 
       if (response.ok) {
         setResponse({